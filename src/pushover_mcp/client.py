@@ -1,16 +1,60 @@
 """Async Pushover API client using httpx."""
 
+import asyncio
+import weakref
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Literal, Optional
+from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup, see the "speedups" extra
+    import json
+    _json_loads = json.loads
+
 # Pushover API base URL
 PUSHOVER_API_BASE = "https://api.pushover.net/1"
 
+# Maximum sends in flight at once from send_messages; matches the number of
+# kept-alive connections so a batch reuses the pool instead of growing it
+MAX_CONCURRENT_SENDS = 20
+
+# Connection pool settings; every request goes to the same host, so keep
+# connections alive between notifications instead of re-handshaking TLS
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=MAX_CONCURRENT_SENDS,
+    keepalive_expiry=60.0,
+)
+
+# Shared HTTP clients, one per event loop. Every PushoverClient draws from the
+# same pool; pooled connections are bound to the loop that opened them, so a
+# new loop gets a fresh client.
+_SHARED_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Headers for pre-encoded form bodies
+_FORM_HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+
+# Emergency (priority 2) defaults: retry every 60 seconds, expire after 1 hour.
+# Pushover requires retry >= 30 and expire <= 10800.
+EMERGENCY_RETRY = 60
+EMERGENCY_EXPIRE = 3600
+
 # Valid priority levels
 Priority = Literal[-2, -1, 0, 1, 2]
 
+# Shared empty value for list fields missing from an API response
+_EMPTY: tuple[str, ...] = ()
+
+# Form-encoded priority values
+_PRIORITY_STR = {-2: "-2", -1: "-1", 0: "0", 1: "1", 2: "2"}
+
 # Available sounds
 SOUNDS = [
     "pushover", "bike", "bugle", "cashregister", "classical", "cosmic",
@@ -18,29 +62,36 @@ SOUNDS = [
     "pianobar", "siren", "spacealarm", "tugboat", "alien", "climb",
     "persistent", "echo", "updown", "vibrate", "none"
 ]
+_SOUNDS_SET = frozenset(SOUNDS)
+
+# Optional text fields of a message and their maximum lengths (None: no limit)
+_TEXT_FIELDS = (("title", 250), ("device", None), ("url", 512), ("url_title", 100))
 
+# Optional integer fields of a message
+_INT_FIELDS = ("ttl", "timestamp")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PushoverResponse:
     """Response from Pushover API."""
     
     success: bool
     request_id: str
-    errors: list[str]
+    errors: tuple[str, ...]
     raw: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResponse:
     """Response from user validation."""
     
     valid: bool
-    devices: list[str]
-    licenses: list[str]
-    errors: list[str]
+    devices: tuple[str, ...]
+    licenses: tuple[str, ...]
+    errors: tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LimitsResponse:
     """Response from limits check."""
     
@@ -49,25 +100,112 @@ class LimitsResponse:
     reset: int  # Unix timestamp
 
 
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create the HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _SHARED_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # httpx's default accept-encoding already lists every decoder it can
+        # use: gzip and deflate, plus br when brotli is installed
+        client = httpx.AsyncClient(
+            base_url=PUSHOVER_API_BASE,
+            timeout=30.0,
+            http2=True,
+            limits=POOL_LIMITS,
+        )
+        _SHARED_CLIENTS[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the HTTP client for the running event loop, if one is open."""
+    client = _SHARED_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 class PushoverClient:
     """Async client for Pushover API."""
     
-    def __init__(self, token: str, user_key: str):
+    def __init__(
+        self,
+        token: str,
+        user_key: str,
+        emergency_retry: int = EMERGENCY_RETRY,
+        emergency_expire: int = EMERGENCY_EXPIRE,
+    ):
+        if emergency_retry < 30:
+            raise ValueError("emergency_retry must be at least 30 seconds")
+        if not 0 < emergency_expire <= 10800:
+            raise ValueError("emergency_expire must be between 1 and 10800 seconds")
         self.token = token
         self.user_key = user_key
-        self._client: Optional[httpx.AsyncClient] = None
+        # Credential fields shared by every request, built once
+        self._base_payload = {"token": token, "user": user_key}
+        self._limits_params = {"token": token}
+        # Encoded "token=...&user=...&", ready to prefix each message body
+        self._credentials_prefix = urlencode(self._base_payload).encode() + b"&"
+        self._emergency_params = {"retry": str(emergency_retry), "expire": str(emergency_expire)}
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        """Get the shared HTTP client for the running event loop."""
+        return get_shared_client()
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Close the shared HTTP client for the running event loop."""
+        await close_shared_client()
+    
+    def _build_payload(
+        self,
+        message: str,
+        title: Optional[str] = None,
+        priority: Priority = 0,
+        sound: Optional[str] = None,
+        device: Optional[str] = None,
+        url: Optional[str] = None,
+        url_title: Optional[str] = None,
+        html: bool = False,
+        ttl: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> dict[str, str]:
+        """Build the form data for a message (see send_message for arguments).
+        
+        Credentials are not included; _post_message prepends them pre-encoded.
+        """
+        data = {"message": message[:1024]}  # Enforce limit
+        
+        for (name, limit), value in zip(_TEXT_FIELDS, (title, device, url, url_title)):
+            if value:
+                data[name] = value[:limit]
+        for name, value in zip(_INT_FIELDS, (ttl, timestamp)):
+            if value is not None:
+                data[name] = str(value)
+        if priority != 0:
+            data["priority"] = _PRIORITY_STR.get(priority) or str(priority)
+            # Priority 2 requires retry and expire
+            if priority == 2:
+                data.update(self._emergency_params)
+        if sound and sound in _SOUNDS_SET:
+            data["sound"] = sound
+        if html:
+            data["html"] = "1"
+        
+        return data
+    
+    async def _post_message(self, data: dict[str, str]) -> PushoverResponse:
+        """Post prepared form data to the messages endpoint."""
+        client = await self._get_client()
+        
+        body = self._credentials_prefix + urlencode(data).encode()
+        response = await client.post("/messages.json", content=body, headers=_FORM_HEADERS)
+        result = _json_loads(response.content)
+        
+        return PushoverResponse(
+            success=result.get("status") == 1,
+            request_id=result.get("request", ""),
+            errors=tuple(result.get("errors") or _EMPTY),
+            raw=result,
+        )
     
     async def send_message(
         self,
@@ -99,46 +237,41 @@ class PushoverClient:
         Returns:
             PushoverResponse with success status
         """
-        client = await self._get_client()
+        return await self._post_message(
+            self._build_payload(
+                message=message,
+                title=title,
+                priority=priority,
+                sound=sound,
+                device=device,
+                url=url,
+                url_title=url_title,
+                html=html,
+                ttl=ttl,
+                timestamp=timestamp,
+            )
+        )
+    
+    async def send_messages(self, messages: Sequence[dict[str, Any]]) -> list[PushoverResponse]:
+        """Send several notifications concurrently.
         
-        data = {
-            "token": self.token,
-            "user": self.user_key,
-            "message": message[:1024],  # Enforce limit
-        }
+        At most MAX_CONCURRENT_SENDS requests are in flight at once, one per
+        kept-alive pool connection; the rest wait for a slot.
         
-        if title:
-            data["title"] = title[:250]
-        if priority != 0:
-            data["priority"] = priority
-            # Priority 2 requires retry and expire
-            if priority == 2:
-                data["retry"] = 60  # Retry every 60 seconds
-                data["expire"] = 3600  # Expire after 1 hour
-        if sound and sound in SOUNDS:
-            data["sound"] = sound
-        if device:
-            data["device"] = device
-        if url:
-            data["url"] = url[:512]
-        if url_title:
-            data["url_title"] = url_title[:100]
-        if html:
-            data["html"] = 1
-        if ttl is not None:
-            data["ttl"] = ttl
-        if timestamp is not None:
-            data["timestamp"] = timestamp
+        Args:
+            messages: Keyword arguments for send_message, one dict per message
+            
+        Returns:
+            PushoverResponse for each message, in the same order
+        """
+        payloads = [self._build_payload(**kwargs) for kwargs in messages]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         
-        response = await client.post(f"{PUSHOVER_API_BASE}/messages.json", data=data)
-        result = response.json()
+        async def post(data: dict[str, str]) -> PushoverResponse:
+            async with semaphore:
+                return await self._post_message(data)
         
-        return PushoverResponse(
-            success=result.get("status") == 1,
-            request_id=result.get("request", ""),
-            errors=result.get("errors", []),
-            raw=result,
-        )
+        return list(await asyncio.gather(*(post(data) for data in payloads)))
     
     async def validate_user(self, device: Optional[str] = None) -> ValidationResponse:
         """Validate user/group key.
@@ -151,21 +284,18 @@ class PushoverClient:
         """
         client = await self._get_client()
         
-        data = {
-            "token": self.token,
-            "user": self.user_key,
-        }
+        data = dict(self._base_payload)
         if device:
             data["device"] = device
         
-        response = await client.post(f"{PUSHOVER_API_BASE}/users/validate.json", data=data)
-        result = response.json()
+        response = await client.post("/users/validate.json", data=data)
+        result = _json_loads(response.content)
         
         return ValidationResponse(
             valid=result.get("status") == 1,
-            devices=result.get("devices", []),
-            licenses=result.get("licenses", []),
-            errors=result.get("errors", []),
+            devices=tuple(result.get("devices") or _EMPTY),
+            licenses=tuple(result.get("licenses") or _EMPTY),
+            errors=tuple(result.get("errors") or _EMPTY),
         )
     
     async def get_limits(self) -> LimitsResponse:
@@ -176,11 +306,8 @@ class PushoverClient:
         """
         client = await self._get_client()
         
-        response = await client.get(
-            f"{PUSHOVER_API_BASE}/apps/limits.json",
-            params={"token": self.token}
-        )
-        result = response.json()
+        response = await client.get("/apps/limits.json", params=self._limits_params)
+        result = _json_loads(response.content)
         
         return LimitsResponse(
             limit=result.get("limit", 0),
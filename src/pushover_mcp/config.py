@@ -3,44 +3,101 @@
 Loads credentials from environment variables with config file fallback.
 """
 
-import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup, see the "speedups" extra
+    import json
+    _json_loads = json.loads
 
-@dataclass
+# Config file location relative to the config home directory
+_CONFIG_SUFFIX = os.path.join("pushover-mcp", "config.json")
+
+# Valid configuration returned by load_config, once loaded
+_config_cache: Optional["PushoverConfig"] = None
+
+# Last parsed config file, as ((path, mtime_ns, size), parsed contents)
+_file_cache: Optional[tuple[tuple[Path, int, int], dict]] = None
+
+
+@dataclass(slots=True, frozen=True)
 class PushoverConfig:
     """Pushover API configuration."""
     
     token: str
     user_key: str
     
+    def __bool__(self) -> bool:
+        """True if credentials are configured, so ``if config:`` works."""
+        return bool(self.token) and bool(self.user_key)
+    
     def is_valid(self) -> bool:
         """Check if credentials are configured."""
-        return bool(self.token and self.user_key)
+        return bool(self)
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """Get the config file path used when XDG_CONFIG_HOME is not set.
+    
+    Resolved on first use rather than at import. expanduser() reads $HOME
+    directly and, unlike Path.home(), does not raise without a home directory.
+    """
+    return Path(os.path.expanduser(os.path.join("~", ".config", _CONFIG_SUFFIX)))
 
 
 def get_config_file_path() -> Path:
     """Get the config file path."""
     # Check XDG_CONFIG_HOME first, then fall back to ~/.config
-    config_home = os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config"))
-    return Path(config_home) / "pushover-mcp" / "config.json"
+    config_home = os.environ.get("XDG_CONFIG_HOME")
+    if config_home:
+        return Path(os.path.join(config_home, _CONFIG_SUFFIX))
+    return _default_config_path()
 
 
 def load_config_from_file(path: Optional[Path] = None) -> dict:
-    """Load configuration from JSON file."""
+    """Load configuration from JSON file.
+    
+    Parsed contents are cached until the file's modification time or size
+    changes; each call returns its own copy.
+    """
+    global _file_cache
     config_path = path or get_config_file_path()
     
-    if not config_path.exists():
+    # A missing file surfaces as FileNotFoundError (an OSError)
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return {}
+    if not stat.st_size:
         return {}
     
+    key = (config_path, stat.st_mtime_ns, stat.st_size)
+    if _file_cache is not None and _file_cache[0] == key:
+        return dict(_file_cache[1])
+    
+    # orjson and json both raise ValueError subclasses on malformed input
     try:
-        with open(config_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        result = _json_loads(config_path.read_bytes())
+    except (ValueError, OSError):
         return {}
+    if not isinstance(result, dict):
+        # Valid JSON but not an object (e.g. a list); treat as no config
+        return {}
+    _file_cache = (key, result)
+    return dict(result)
+
+
+def _reset_file_cache() -> None:
+    """Forget the cached config file contents."""
+    global _file_cache
+    _file_cache = None
 
 
 def load_config() -> PushoverConfig:
@@ -49,15 +106,32 @@ def load_config() -> PushoverConfig:
     Priority:
     1. Environment variables (PUSHOVER_TOKEN, PUSHOVER_USER_KEY)
     2. Config file (~/.config/pushover-mcp/config.json)
+    
+    A valid configuration is cached for the life of the process. An invalid
+    one is not, so credentials added after startup are picked up.
     """
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
+    
     # Try environment variables first
-    token = os.environ.get("PUSHOVER_TOKEN", "")
-    user_key = os.environ.get("PUSHOVER_USER_KEY", "")
+    env = os.environ
+    token = env.get("PUSHOVER_TOKEN", "")
+    user_key = env.get("PUSHOVER_USER_KEY", "")
     
-    # Fall back to config file if env vars not set
-    if not token or not user_key:
+    # Fall back to config file only if an env var is missing
+    if not (token and user_key):
         file_config = load_config_from_file()
         token = token or file_config.get("token", "")
         user_key = user_key or file_config.get("user_key", "")
     
-    return PushoverConfig(token=token, user_key=user_key)
+    config = PushoverConfig(token=token, user_key=user_key)
+    if config:
+        _config_cache = config
+    return config
+
+
+def _reset_config_cache() -> None:
+    """Forget the cached configuration."""
+    global _config_cache
+    _config_cache = None
@@ -1,16 +1,60 @@
 """FastMCP server for Pushover notifications."""
 
+import os
 import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated, Literal, Optional
 
 import click
+import httpx
 from mcp.server.fastmcp import FastMCP
 
-from .client import SOUNDS, PushoverClient
+from .client import _SOUNDS_SET, SOUNDS, PushoverClient, close_shared_client
 from .config import load_config
 
+# Priorities accepted by pushover_send
+_VALID_PRIORITIES = frozenset((-2, -1, 0, 1, 2))
+
+# Default seconds a pushover_health result is reused before validating again
+DEFAULT_HEALTH_TTL = 30.0
+
+
+def _health_ttl_from_env() -> float:
+    """Read PUSHOVER_HEALTH_CACHE_TTL, falling back to the default if malformed."""
+    try:
+        ttl = float(os.environ.get("PUSHOVER_HEALTH_CACHE_TTL", DEFAULT_HEALTH_TTL))
+    except ValueError:
+        return DEFAULT_HEALTH_TTL
+    # Negative (or NaN) values disable the cache
+    return ttl if ttl >= 0 else 0.0
+
+
+_HEALTH_TTL = _health_ttl_from_env()
+
+# Last pushover_health result from the API, as (time.monotonic(), result)
+_health_cache: Optional[tuple[float, dict]] = None
+
+# Number of sessions currently running (SSE mode can serve several at once)
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP connection pool once the last session ends."""
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_shared_client()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Pushover MCP Server")
+mcp = FastMCP("Pushover MCP Server", lifespan=lifespan)
 
 # Global client instance (initialized on first use)
 _client: Optional[PushoverClient] = None
@@ -21,7 +65,7 @@ def get_client() -> PushoverClient:
     global _client
     if _client is None:
         config = load_config()
-        if not config.is_valid():
+        if not config:
             raise ValueError(
                 "Pushover credentials not configured. "
                 "Set PUSHOVER_TOKEN and PUSHOVER_USER_KEY environment variables, "
@@ -51,7 +95,7 @@ async def pushover_send(
     client = get_client()
     
     # Validate priority
-    if priority not in (-2, -1, 0, 1, 2):
+    if priority not in _VALID_PRIORITIES:
         return {"success": False, "error": "Priority must be between -2 and 2"}
     
     response = await client.send_message(
@@ -97,7 +141,7 @@ async def pushover_send_urgent(
         message=message,
         title=title,
         priority=1,
-        sound=sound if sound in SOUNDS else "siren",
+        sound=sound if sound in _SOUNDS_SET else "siren",
     )
     
     if response.success:
@@ -162,10 +206,15 @@ async def pushover_health() -> dict:
     """Check Pushover MCP server health.
     
     Validates credentials and confirms the server is working correctly.
+    Results are reused for PUSHOVER_HEALTH_CACHE_TTL seconds (default 30).
     """
+    global _health_cache
+    if _health_cache is not None and time.monotonic() - _health_cache[0] < _HEALTH_TTL:
+        return dict(_health_cache[1])
+    
     try:
         config = load_config()
-        if not config.is_valid():
+        if not config:
             return {
                 "status": "unhealthy",
                 "error": "Credentials not configured",
@@ -175,22 +224,27 @@ async def pushover_health() -> dict:
         response = await client.validate_user()
         
         if response.valid:
-            return {
+            result = {
                 "status": "healthy",
                 "credentials_valid": True,
                 "devices": response.devices,
             }
         else:
-            return {
+            result = {
                 "status": "unhealthy",
                 "credentials_valid": False,
                 "errors": response.errors,
             }
-    except Exception as e:
+    except (httpx.HTTPError, ValueError, OSError) as e:
+        # Network failures, bad responses and missing credentials; anything
+        # else is a bug and should propagate
         return {
             "status": "error",
             "error": str(e),
         }
+    
+    _health_cache = (time.monotonic(), result)
+    return dict(result)
 
 
 @click.command()
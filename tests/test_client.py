@@ -1,9 +1,16 @@
 """Tests for Pushover API client."""
 
+import asyncio
+from dataclasses import FrozenInstanceError
+
+import httpx
 import pytest
+import pytest_asyncio
 from pytest_httpx import HTTPXMock
 
 from pushover_mcp.client import (
+    _SHARED_CLIENTS,
+    MAX_CONCURRENT_SENDS,
     PUSHOVER_API_BASE,
     SOUNDS,
     LimitsResponse,
@@ -13,14 +20,20 @@ from pushover_mcp.client import (
 )
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create a test client shared by the whole session."""
+    client = PushoverClient(token="test_token", user_key="test_user_key")
+    yield client
+    await client.close()
+
+
+# Client tests run on one session-wide event loop so the shared connection
+# pool is reused across tests, as it is in the server
+@pytest.mark.asyncio(loop_scope="session")
 class TestPushoverClient:
     """Tests for PushoverClient class."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        return PushoverClient(token="test_token", user_key="test_user_key")
-
     async def test_send_message_success(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Successfully sends a message."""
         httpx_mock.add_response(
@@ -33,7 +46,11 @@ class TestPushoverClient:
 
         assert response.success is True
         assert response.request_id == "req123"
-        assert response.errors == []
+        assert response.errors == ()
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert "gzip" in request.headers["accept-encoding"]
 
     async def test_send_message_with_all_options(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Sends message with all optional parameters."""
@@ -61,7 +78,9 @@ class TestPushoverClient:
         # Verify the request was made with correct data
         request = httpx_mock.get_request()
         assert request is not None
+        assert request.headers["content-type"] == "application/x-www-form-urlencoded"
         body = request.content.decode()
+        assert body.startswith("token=test_token&user=test_user_key&")
         assert "message=Test+message" in body
         assert "title=Test+Title" in body
         assert "priority=1" in body
@@ -105,6 +124,24 @@ class TestPushoverClient:
         assert "t" * 250 in body
         assert "t" * 251 not in body
 
+    async def test_send_message_truncates_long_url(self, client: PushoverClient, httpx_mock: HTTPXMock):
+        """URL and URL title are truncated to 512 and 100 characters."""
+        httpx_mock.add_response(
+            url=f"{PUSHOVER_API_BASE}/messages.json",
+            method="POST",
+            json={"status": 1, "request": "req001"},
+        )
+
+        await client.send_message("test", url="u" * 600, url_title="v" * 200)
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        body = request.content.decode()
+        assert "u" * 512 in body
+        assert "u" * 513 not in body
+        assert "v" * 100 in body
+        assert "v" * 101 not in body
+
     async def test_send_message_priority_2_adds_retry_expire(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Emergency priority (2) adds retry and expire parameters."""
         httpx_mock.add_response(
@@ -122,6 +159,28 @@ class TestPushoverClient:
         assert "retry=60" in body
         assert "expire=3600" in body
 
+    async def test_send_message_custom_emergency_params(self, httpx_mock: HTTPXMock):
+        """Emergency retry and expire can be configured per client."""
+        httpx_mock.add_response(
+            url=f"{PUSHOVER_API_BASE}/messages.json",
+            method="POST",
+            json={"status": 1, "request": "emergency"},
+        )
+        client = PushoverClient(
+            token="test_token",
+            user_key="test_user_key",
+            emergency_retry=30,
+            emergency_expire=600,
+        )
+
+        await client.send_message("Emergency!", priority=2)
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        body = request.content.decode()
+        assert "retry=30" in body
+        assert "expire=600" in body
+
     async def test_send_message_invalid_sound_ignored(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Invalid sound name is not included in request."""
         httpx_mock.add_response(
@@ -149,7 +208,53 @@ class TestPushoverClient:
 
         assert response.success is False
         assert response.request_id == "err123"
-        assert response.errors == ["invalid token"]
+        assert response.errors == ("invalid token",)
+
+    async def test_send_messages(self, client: PushoverClient, httpx_mock: HTTPXMock):
+        """Sends several messages and returns responses in order."""
+        httpx_mock.add_response(
+            url=f"{PUSHOVER_API_BASE}/messages.json",
+            method="POST",
+            match_content=b"token=test_token&user=test_user_key&message=first",
+            json={"status": 1, "request": "req1"},
+        )
+        httpx_mock.add_response(
+            url=f"{PUSHOVER_API_BASE}/messages.json",
+            method="POST",
+            match_content=b"token=test_token&user=test_user_key&message=second&title=Second",
+            json={"status": 0, "request": "req2", "errors": ["bad"]},
+        )
+
+        responses = await client.send_messages([
+            {"message": "first"},
+            {"message": "second", "title": "Second"},
+        ])
+
+        assert [r.request_id for r in responses] == ["req1", "req2"]
+        assert [r.success for r in responses] == [True, False]
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_send_messages_limits_concurrency(self, client: PushoverClient, httpx_mock: HTTPXMock):
+        """No more than MAX_CONCURRENT_SENDS requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"status": 1, "request": "req"})
+
+        httpx_mock.add_callback(respond, url=f"{PUSHOVER_API_BASE}/messages.json", is_reusable=True)
+
+        count = MAX_CONCURRENT_SENDS + 5
+        responses = await client.send_messages([{"message": f"m{i}"} for i in range(count)])
+
+        assert len(responses) == count
+        assert all(r.success for r in responses)
+        assert peak == MAX_CONCURRENT_SENDS
 
     async def test_validate_user_success(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Successfully validates user."""
@@ -166,9 +271,9 @@ class TestPushoverClient:
         response = await client.validate_user()
 
         assert response.valid is True
-        assert response.devices == ["iphone", "desktop"]
-        assert response.licenses == ["iOS"]
-        assert response.errors == []
+        assert response.devices == ("iphone", "desktop")
+        assert response.licenses == ("iOS",)
+        assert response.errors == ()
 
     async def test_validate_user_with_device(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Validates specific device."""
@@ -196,7 +301,9 @@ class TestPushoverClient:
         response = await client.validate_user()
 
         assert response.valid is False
-        assert response.errors == ["invalid user key"]
+        assert response.devices == ()
+        assert response.licenses == ()
+        assert response.errors == ("invalid user key",)
 
     async def test_get_limits(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """Gets API limits."""
@@ -220,13 +327,15 @@ class TestPushoverClient:
             json={"status": 1, "request": "req"},
         )
 
-        # Use the client to create internal httpx client
+        # Use the client to create the shared httpx client
         await client.send_message("test")
-        assert client._client is not None
+        http_client = await client._get_client()
+        assert http_client in _SHARED_CLIENTS.values()
 
         # Close should work
         await client.close()
-        assert client._client is None
+        assert http_client.is_closed
+        assert http_client not in _SHARED_CLIENTS.values()
 
     async def test_client_reuses_http_client(self, client: PushoverClient, httpx_mock: HTTPXMock):
         """HTTP client is reused across calls."""
@@ -242,13 +351,32 @@ class TestPushoverClient:
         )
 
         await client.send_message("first")
-        first_client = client._client
+        first_client = await client._get_client()
 
         await client.send_message("second")
-        second_client = client._client
+        second_client = await client._get_client()
 
         assert first_client is second_client
 
+    async def test_clients_share_http_client(self, client: PushoverClient):
+        """All PushoverClient instances share one HTTP client per event loop."""
+        other = PushoverClient(token="other_token", user_key="other_user_key")
+
+        assert await client._get_client() is await other._get_client()
+
+
+class TestPushoverClientInit:
+    """Tests for PushoverClient construction."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"emergency_retry": 10}, {"emergency_expire": 0}, {"emergency_expire": 20000}],
+    )
+    def test_invalid_emergency_params(self, kwargs):
+        """Out-of-range emergency retry/expire values are rejected."""
+        with pytest.raises(ValueError):
+            PushoverClient(token="test_token", user_key="test_user_key", **kwargs)
+
 
 class TestSOUNDS:
     """Tests for the SOUNDS constant."""
@@ -273,26 +401,26 @@ class TestResponseDataclasses:
         response = PushoverResponse(
             success=True,
             request_id="abc123",
-            errors=["error1"],
+            errors=("error1",),
             raw={"status": 1},
         )
         assert response.success is True
         assert response.request_id == "abc123"
-        assert response.errors == ["error1"]
+        assert response.errors == ("error1",)
         assert response.raw == {"status": 1}
 
     def test_validation_response(self):
         """ValidationResponse stores all fields."""
         response = ValidationResponse(
             valid=True,
-            devices=["phone"],
-            licenses=["iOS"],
-            errors=[],
+            devices=("phone",),
+            licenses=("iOS",),
+            errors=(),
         )
         assert response.valid is True
-        assert response.devices == ["phone"]
-        assert response.licenses == ["iOS"]
-        assert response.errors == []
+        assert response.devices == ("phone",)
+        assert response.licenses == ("iOS",)
+        assert response.errors == ()
 
     def test_limits_response(self):
         """LimitsResponse stores all fields."""
@@ -304,3 +432,10 @@ class TestResponseDataclasses:
         assert response.limit == 10000
         assert response.remaining == 5000
         assert response.reset == 1234567890
+
+    def test_responses_are_immutable(self):
+        """Response objects are frozen and have no instance __dict__."""
+        response = LimitsResponse(limit=1, remaining=1, reset=0)
+        with pytest.raises(FrozenInstanceError):
+            response.limit = 2  # type: ignore[misc]
+        assert not hasattr(response, "__dict__")
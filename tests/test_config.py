@@ -1,163 +1,256 @@
 """Tests for configuration handling."""
 
 import json
-import os
+from dataclasses import FrozenInstanceError, asdict
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 
 from pushover_mcp.config import (
     PushoverConfig,
+    _default_config_path,
+    _reset_config_cache,
+    _reset_file_cache,
     get_config_file_path,
     load_config,
     load_config_from_file,
 )
 
 
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Temporary directory shared by the config file tests in this module."""
+    return tmp_path_factory.mktemp("cfg")
+
+
+@pytest.fixture(autouse=True)
+def reset_file_cache():
+    """Start each test without a cached config file.
+
+    Tests reuse the same file path, so a cached parse must not leak between them.
+    """
+    _reset_file_cache()
+    yield
+    _reset_file_cache()
+
+
 class TestPushoverConfig:
     """Tests for PushoverConfig dataclass."""
 
-    def test_is_valid_with_both_credentials(self):
-        """Config is valid when both token and user_key are set."""
+    @pytest.mark.parametrize(
+        "token,user_key,expected",
+        [
+            ("abc123", "user456", True),
+            ("", "user456", False),
+            ("abc123", "", False),
+            ("", "", False),
+        ],
+        ids=["both_credentials", "empty_token", "empty_user_key", "both_empty"],
+    )
+    def test_is_valid(self, token, user_key, expected):
+        """Config is valid (and truthy) only when both token and user_key are set."""
+        config = PushoverConfig(token=token, user_key=user_key)
+        assert config.is_valid() is expected
+        assert bool(config) is expected
+
+    def test_is_immutable(self):
+        """Config is frozen, so the cached instance cannot be modified."""
         config = PushoverConfig(token="abc123", user_key="user456")
-        assert config.is_valid() is True
+        with pytest.raises(FrozenInstanceError):
+            config.token = "other"  # type: ignore[misc]
 
-    def test_is_valid_with_empty_token(self):
-        """Config is invalid when token is empty."""
-        config = PushoverConfig(token="", user_key="user456")
-        assert config.is_valid() is False
-
-    def test_is_valid_with_empty_user_key(self):
-        """Config is invalid when user_key is empty."""
-        config = PushoverConfig(token="abc123", user_key="")
-        assert config.is_valid() is False
+    def test_uses_slots(self):
+        """Config instances are slotted with no __dict__ or __weakref__ slot."""
+        config = PushoverConfig(token="abc123", user_key="user456")
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config, "__weakref__")
 
-    def test_is_valid_with_both_empty(self):
-        """Config is invalid when both are empty."""
-        config = PushoverConfig(token="", user_key="")
-        assert config.is_valid() is False
+    def test_asdict_has_only_credentials(self):
+        """Serializing the config exposes only its public fields."""
+        config = PushoverConfig(token="abc123", user_key="user456")
+        assert asdict(config) == {"token": "abc123", "user_key": "user456"}
 
 
 class TestGetConfigFilePath:
     """Tests for get_config_file_path function."""
 
-    def test_default_path(self):
+    def test_default_path(self, monkeypatch):
         """Uses ~/.config when XDG_CONFIG_HOME is not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Remove XDG_CONFIG_HOME if it exists
-            os.environ.pop("XDG_CONFIG_HOME", None)
-            path = get_config_file_path()
-            assert path == Path.home() / ".config" / "pushover-mcp" / "config.json"
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        _default_config_path.cache_clear()
+
+        path = get_config_file_path()
+        assert path == Path.home() / ".config" / "pushover-mcp" / "config.json"
 
-    def test_xdg_config_home(self):
+    def test_xdg_config_home(self, monkeypatch):
         """Uses XDG_CONFIG_HOME when set."""
-        with patch.dict(os.environ, {"XDG_CONFIG_HOME": "/custom/config"}):
-            path = get_config_file_path()
-            assert path == Path("/custom/config/pushover-mcp/config.json")
+        monkeypatch.setenv("XDG_CONFIG_HOME", "/custom/config")
+
+        path = get_config_file_path()
+        assert path == Path("/custom/config/pushover-mcp/config.json")
 
 
 class TestLoadConfigFromFile:
     """Tests for load_config_from_file function."""
 
-    def test_nonexistent_file_returns_empty_dict(self, tmp_path):
+    _VALID_JSON = b'{"token": "test_token", "user_key": "test_user"}'
+    _INVALID_JSON = b"not valid json {"
+
+    def test_nonexistent_file_returns_empty_dict(self, shared_tmp):
         """Returns empty dict when file doesn't exist."""
-        result = load_config_from_file(tmp_path / "nonexistent.json")
+        missing = shared_tmp / "nonexistent.json"
+        missing.unlink(missing_ok=True)
+
+        result = load_config_from_file(missing)
         assert result == {}
 
-    def test_valid_json_file(self, tmp_path):
-        """Loads valid JSON config file."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text('{"token": "test_token", "user_key": "test_user"}')
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (_VALID_JSON, {"token": "test_token", "user_key": "test_user"}),
+            (_INVALID_JSON, {}),
+            (b"", {}),
+            (b'["token", "user_key"]', {}),
+        ],
+        ids=["valid_json", "invalid_json", "empty_file", "not_an_object"],
+    )
+    def test_file_contents(self, shared_tmp, content, expected):
+        """Loads valid JSON and returns empty dict for invalid or empty files."""
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(content)
 
         result = load_config_from_file(config_file)
-        assert result == {"token": "test_token", "user_key": "test_user"}
+        assert result == expected
 
-    def test_invalid_json_returns_empty_dict(self, tmp_path):
-        """Returns empty dict for invalid JSON."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text("not valid json {")
+    def test_unchanged_file_is_not_reread(self, shared_tmp, monkeypatch):
+        """Repeated loads of an unchanged file skip reading and parsing it."""
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(self._VALID_JSON)
 
-        result = load_config_from_file(config_file)
-        assert result == {}
+        first = load_config_from_file(config_file)
+        mock_loads = Mock()
+        monkeypatch.setattr("pushover_mcp.config._json_loads", mock_loads)
+        mock_read = Mock()
+        monkeypatch.setattr(Path, "read_bytes", mock_read)
+        assert load_config_from_file(config_file) == first
+        mock_loads.assert_not_called()
+        mock_read.assert_not_called()
 
-    def test_empty_file_returns_empty_dict(self, tmp_path):
-        """Returns empty dict for empty file."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text("")
+    def test_cached_result_is_a_copy(self, shared_tmp):
+        """Mutating a returned dict does not affect later loads."""
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(self._VALID_JSON)
 
-        result = load_config_from_file(config_file)
-        assert result == {}
+        load_config_from_file(config_file)["token"] = "mutated"
+        assert load_config_from_file(config_file)["token"] == "test_token"
+
+    def test_modified_file_is_reloaded(self, shared_tmp):
+        """Changing the file invalidates the cached result."""
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(b'{"token": "old"}')
+        assert load_config_from_file(config_file) == {"token": "old"}
+
+        config_file.write_bytes(b'{"token": "new_token"}')
+        assert load_config_from_file(config_file) == {"token": "new_token"}
 
 
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_loads_from_environment_variables(self):
+    _FILE_JSON = b'{"token": "file_token", "user_key": "file_user"}'
+
+    @pytest.fixture(autouse=True)
+    def clear_config_cache(self):
+        """Drop the cached config around each test."""
+        _reset_config_cache()
+        yield
+        _reset_config_cache()
+
+    @pytest.fixture(autouse=True)
+    def clear_credential_env(self, monkeypatch):
+        """Start each test without credential env vars."""
+        monkeypatch.delenv("PUSHOVER_TOKEN", raising=False)
+        monkeypatch.delenv("PUSHOVER_USER_KEY", raising=False)
+
+    def test_loads_from_environment_variables(self, monkeypatch):
         """Environment variables take priority."""
-        with patch.dict(
-            os.environ,
-            {"PUSHOVER_TOKEN": "env_token", "PUSHOVER_USER_KEY": "env_user"},
-        ):
-            config = load_config()
-            assert config.token == "env_token"
-            assert config.user_key == "env_user"
-            assert config.is_valid() is True
-
-    def test_falls_back_to_config_file(self, tmp_path):
+        monkeypatch.setenv("PUSHOVER_TOKEN", "env_token")
+        monkeypatch.setenv("PUSHOVER_USER_KEY", "env_user")
+
+        config = load_config()
+        assert config.token == "env_token"
+        assert config.user_key == "env_user"
+        assert config.is_valid() is True
+
+    def test_skips_config_file_when_env_complete(self, monkeypatch):
+        """Config file is not read when both env vars are set."""
+        monkeypatch.setenv("PUSHOVER_TOKEN", "env_token")
+        monkeypatch.setenv("PUSHOVER_USER_KEY", "env_user")
+
+        mock_load = Mock()
+        monkeypatch.setattr("pushover_mcp.config.load_config_from_file", mock_load)
+        load_config()
+        mock_load.assert_not_called()
+
+    def test_falls_back_to_config_file(self, shared_tmp, monkeypatch):
         """Falls back to config file when env vars not set."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text('{"token": "file_token", "user_key": "file_user"}')
-
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("PUSHOVER_TOKEN", None)
-            os.environ.pop("PUSHOVER_USER_KEY", None)
-            with patch(
-                "pushover_mcp.config.get_config_file_path", return_value=config_file
-            ):
-                config = load_config()
-                assert config.token == "file_token"
-                assert config.user_key == "file_user"
-
-    def test_env_vars_override_config_file(self, tmp_path):
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(self._FILE_JSON)
+        monkeypatch.setattr("pushover_mcp.config.get_config_file_path", lambda: config_file)
+
+        config = load_config()
+        assert config.token == "file_token"
+        assert config.user_key == "file_user"
+
+    def test_env_vars_override_config_file(self, shared_tmp, monkeypatch):
         """Environment variables override config file values."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text('{"token": "file_token", "user_key": "file_user"}')
-
-        with patch.dict(
-            os.environ,
-            {"PUSHOVER_TOKEN": "env_token", "PUSHOVER_USER_KEY": "env_user"},
-        ):
-            with patch(
-                "pushover_mcp.config.get_config_file_path", return_value=config_file
-            ):
-                config = load_config()
-                assert config.token == "env_token"
-                assert config.user_key == "env_user"
-
-    def test_partial_env_vars_with_file_fallback(self, tmp_path):
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(self._FILE_JSON)
+        monkeypatch.setenv("PUSHOVER_TOKEN", "env_token")
+        monkeypatch.setenv("PUSHOVER_USER_KEY", "env_user")
+        monkeypatch.setattr("pushover_mcp.config.get_config_file_path", lambda: config_file)
+
+        config = load_config()
+        assert config.token == "env_token"
+        assert config.user_key == "env_user"
+
+    def test_partial_env_vars_with_file_fallback(self, shared_tmp, monkeypatch):
         """Can use env var for one and file for another."""
-        config_file = tmp_path / "config.json"
-        config_file.write_text('{"token": "file_token", "user_key": "file_user"}')
-
-        with patch.dict(os.environ, {"PUSHOVER_TOKEN": "env_token"}, clear=True):
-            os.environ.pop("PUSHOVER_USER_KEY", None)
-            with patch(
-                "pushover_mcp.config.get_config_file_path", return_value=config_file
-            ):
-                config = load_config()
-                assert config.token == "env_token"
-                assert config.user_key == "file_user"
-
-    def test_returns_empty_config_when_nothing_configured(self):
+        config_file = shared_tmp / "config.json"
+        config_file.write_bytes(self._FILE_JSON)
+        monkeypatch.setenv("PUSHOVER_TOKEN", "env_token")
+        monkeypatch.setattr("pushover_mcp.config.get_config_file_path", lambda: config_file)
+
+        config = load_config()
+        assert config.token == "env_token"
+        assert config.user_key == "file_user"
+
+    def test_returns_empty_config_when_nothing_configured(self, monkeypatch):
         """Returns config with empty strings when nothing is configured."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("PUSHOVER_TOKEN", None)
-            os.environ.pop("PUSHOVER_USER_KEY", None)
-            with patch(
-                "pushover_mcp.config.load_config_from_file", return_value={}
-            ):
-                config = load_config()
-                assert config.token == ""
-                assert config.user_key == ""
-                assert config.is_valid() is False
+        monkeypatch.setattr("pushover_mcp.config.load_config_from_file", lambda: {})
+
+        config = load_config()
+        assert config.token == ""
+        assert config.user_key == ""
+        assert config.is_valid() is False
+
+    def test_result_is_cached(self, monkeypatch):
+        """Repeated calls return the cached config without reloading."""
+        monkeypatch.setenv("PUSHOVER_TOKEN", "env_token")
+        monkeypatch.setenv("PUSHOVER_USER_KEY", "env_user")
+        first = load_config()
+
+        monkeypatch.setenv("PUSHOVER_TOKEN", "changed")
+        assert load_config() is first
+
+    def test_invalid_config_is_not_cached(self, monkeypatch):
+        """Credentials configured after an invalid load are picked up."""
+        monkeypatch.setattr("pushover_mcp.config.load_config_from_file", lambda: {})
+        assert load_config().is_valid() is False
+
+        monkeypatch.setenv("PUSHOVER_TOKEN", "env_token")
+        monkeypatch.setenv("PUSHOVER_USER_KEY", "env_user")
+        config = load_config()
+        assert config.is_valid() is True
+        assert config.token == "env_token"
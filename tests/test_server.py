@@ -0,0 +1,137 @@
+"""Tests for MCP server tools."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from pushover_mcp import server
+from pushover_mcp.client import _SHARED_CLIENTS, ValidationResponse, get_shared_client
+from pushover_mcp.config import PushoverConfig
+
+
+class TestLifespan:
+    """Tests for the session lifespan that owns the shared connection pool."""
+
+    async def test_closes_pool_after_last_session(self, monkeypatch):
+        """The shared client stays open until the outermost session ends."""
+        monkeypatch.setattr(server, "_active_sessions", 0)
+
+        async with server.lifespan(server.mcp):
+            async with server.lifespan(server.mcp):
+                http_client = get_shared_client()
+            assert not http_client.is_closed
+            assert http_client in _SHARED_CLIENTS.values()
+
+        assert http_client.is_closed
+        assert http_client not in _SHARED_CLIENTS.values()
+
+
+class TestHealthTTLFromEnv:
+    """Tests for reading PUSHOVER_HEALTH_CACHE_TTL."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(None, 30.0), ("10", 10.0), ("0", 0.0), ("-5", 0.0), ("abc", 30.0), ("nan", 0.0)],
+        ids=["unset", "valid", "zero", "negative", "malformed", "nan"],
+    )
+    def test_parses_env(self, monkeypatch, value, expected):
+        """Malformed values fall back to the default; negatives clamp to 0."""
+        if value is None:
+            monkeypatch.delenv("PUSHOVER_HEALTH_CACHE_TTL", raising=False)
+        else:
+            monkeypatch.setenv("PUSHOVER_HEALTH_CACHE_TTL", value)
+        assert server._health_ttl_from_env() == expected
+
+
+class TestPushoverHealth:
+    """Tests for pushover_health result caching."""
+
+    @pytest.fixture
+    def now(self, monkeypatch):
+        """Controllable clock for the server module."""
+        clock = [1000.0]
+        monkeypatch.setattr(server, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+        return clock
+
+    @pytest.fixture
+    def validate(self, monkeypatch):
+        """Mocked validate_user on a client returned by get_client."""
+        validate = AsyncMock(
+            return_value=ValidationResponse(valid=True, devices=("phone",), licenses=(), errors=())
+        )
+        monkeypatch.setattr(server, "get_client", lambda: SimpleNamespace(validate_user=validate))
+        return validate
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """Start each test with an empty cache, valid credentials and a 30s TTL."""
+        monkeypatch.setattr(server, "_health_cache", None)
+        monkeypatch.setattr(server, "_HEALTH_TTL", 30.0)
+        monkeypatch.setattr(server, "load_config", lambda: PushoverConfig(token="t", user_key="u"))
+
+    async def test_serves_cached_result_within_ttl(self, now, validate):
+        """A second call inside the TTL does not hit the API."""
+        first = await server.pushover_health()
+        now[0] += 29
+        second = await server.pushover_health()
+
+        assert first["status"] == "healthy"
+        assert second == first
+        assert second is not first
+        assert validate.await_count == 1
+
+    async def test_refreshes_after_ttl(self, now, validate):
+        """A call after the TTL validates again."""
+        await server.pushover_health()
+        now[0] += 31
+        await server.pushover_health()
+
+        assert validate.await_count == 2
+
+    async def test_zero_ttl_disables_cache(self, monkeypatch, now, validate):
+        """With a TTL of 0 every call validates."""
+        monkeypatch.setattr(server, "_HEALTH_TTL", 0.0)
+
+        await server.pushover_health()
+        await server.pushover_health()
+
+        assert validate.await_count == 2
+
+    async def test_missing_credentials_not_cached(self, monkeypatch, now, validate):
+        """An unconfigured result is not cached, so configuring later is seen."""
+        monkeypatch.setattr(server, "load_config", lambda: PushoverConfig(token="", user_key=""))
+        result = await server.pushover_health()
+        assert result["status"] == "unhealthy"
+
+        monkeypatch.setattr(server, "load_config", lambda: PushoverConfig(token="t", user_key="u"))
+        result = await server.pushover_health()
+        assert result["status"] == "healthy"
+        assert validate.await_count == 1
+
+    async def test_errors_not_cached(self, now, validate):
+        """A failed validation is not cached."""
+        validate.side_effect = httpx.ConnectError("boom")
+        result = await server.pushover_health()
+        assert result == {"status": "error", "error": "boom"}
+
+        validate.side_effect = None
+        result = await server.pushover_health()
+        assert result["status"] == "healthy"
+        assert validate.await_count == 2
+
+    async def test_value_error_reported_as_error(self, now, validate):
+        """A ValueError (e.g. a non-JSON response body) is reported as a status."""
+        validate.side_effect = ValueError("not json")
+
+        result = await server.pushover_health()
+
+        assert result == {"status": "error", "error": "not json"}
+
+    async def test_unexpected_error_propagates(self, now, validate):
+        """Unexpected exceptions are bugs and propagate instead of becoming a status."""
+        validate.side_effect = RuntimeError("bug")
+
+        with pytest.raises(RuntimeError, match="bug"):
+            await server.pushover_health()